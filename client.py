@@ -1,5 +1,251 @@
-import requests
+import asyncio
+import base64
+import functools
 import json
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+
+import aiohttp
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+
+# Upper bound on concurrent connections per host; bulk helpers never use more
+# worker threads than this so they don't block waiting on the pool.
+_POOL_MAXSIZE = 20
+
+# Invariant request headers, read-only so threaded bulk calls can't mutate them.
+_JSON_HEADERS = MappingProxyType({"Content-Type": "application/json"})
+_FORM_HEADERS = MappingProxyType({"Content-Type": "application/x-www-form-urlencoded"})
+
+# Transient failures are retried on the pooled connections with backoff rather
+# than surfacing to the caller. Status-based retries are limited to GET: the
+# server has no idempotency keys, so a POST answered with a 5xx may already
+# have created a poll or recorded a vote. Connection failures are retried for
+# every method since the request never reached the server. Other errors,
+# such as a failed certificate check, are not transient and fail at once.
+_RETRY = Retry(
+    total=3,
+    other=0,
+    backoff_factor=0.2,
+    status_forcelist=(502, 503, 504),
+    allowed_methods=frozenset({"GET"}),
+    respect_retry_after_header=True,
+    raise_on_status=False,
+)
+
+# Shared session so consecutive calls reuse keep-alive connections instead of
+# paying a fresh TCP (and TLS) handshake per request.
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(
+    pool_connections=10, pool_maxsize=_POOL_MAXSIZE, pool_block=False, max_retries=_RETRY
+)
+_SESSION.mount("http://", _ADAPTER)
+_SESSION.mount("https://", _ADAPTER)
+_SESSION.headers.update(_JSON_HEADERS)
+
+# When set, each call uses a throwaway session sending "Connection: close"
+# instead of the pool; see set_one_shot.
+_ONE_SHOT = False
+
+# URL -> (ETag, raw body) of the most recent GETs, replayed when the server
+# answers a conditional request with 304 Not Modified. Kept in LRU order and
+# capped so distinct skip/limit URLs don't accumulate for the process lifetime.
+_ETAG_CACHE_SIZE = 128
+_ETAG_CACHE = OrderedDict()
+_ETAG_LOCK = threading.Lock()
+
+
+class PollyAPIError(Exception):
+    """Raised when the API server answers with an error status.
+
+    Attributes:
+        response: The HTTP response that carried the error.
+    """
+
+    def __init__(self, message, response=None):
+        super().__init__(message)
+        self.response = response
+
+
+class AuthError(PollyAPIError):
+    """Raised on 401 responses (missing, invalid or expired token)."""
+
+
+class NotFoundError(PollyAPIError):
+    """Raised on 404 responses (unknown poll or option)."""
+
+
+class ConflictError(PollyAPIError):
+    """Raised on 400 responses (e.g. username taken, bad credentials)."""
+
+
+_STATUS_MAP = {401: AuthError, 404: NotFoundError, 400: ConflictError}
+
+
+def _api_error(http_err, status, response):
+    """Builds the PollyAPIError subclass matching an HTTP error status."""
+    return _STATUS_MAP.get(status, PollyAPIError)(str(http_err), response=response)
+
+
+def _decode(response):
+    """Parses a JSON response body with orjson.
+
+    Raises requests.exceptions.JSONDecodeError, like response.json() does, so
+    callers catching RequestException still handle non-JSON bodies.
+    """
+    try:
+        return orjson.loads(response.content)
+    except orjson.JSONDecodeError as err:
+        raise requests.exceptions.JSONDecodeError(
+            err.msg, err.doc, err.pos, response=response
+        ) from err
+
+
+async def _adecode(response):
+    """Parses an aiohttp JSON response body with orjson.
+
+    Raises aiohttp.ContentTypeError, as response.json() does for a non-JSON
+    content type, so callers catching aiohttp.ClientError still handle
+    non-JSON bodies.
+    """
+    try:
+        return await response.json(loads=orjson.loads)
+    except orjson.JSONDecodeError as err:
+        raise aiohttp.ContentTypeError(
+            response.request_info,
+            response.history,
+            status=response.status,
+            message=f"Invalid JSON body: {err}",
+            headers=response.headers,
+        ) from err
+
+
+_URLs = namedtuple("_URLs", "register polls login vote_tpl results_tpl")
+
+
+@functools.lru_cache(maxsize=32)
+def _urls(base_url):
+    """Returns the endpoint URLs for a base URL, formatted once per host."""
+    return _URLs(
+        register=f"{base_url}/register",
+        polls=f"{base_url}/polls",
+        login=f"{base_url}/login",
+        vote_tpl=f"{base_url}/polls/{{poll_id}}/vote",
+        results_tpl=f"{base_url}/polls/{{poll_id}}/results",
+    )
+
+
+def set_auth_token(token):
+    """Sends the given JWT token with every subsequent request.
+
+    Args:
+        token (str): The JWT token for authentication.
+    """
+    _SESSION.headers["Authorization"] = f"Bearer {token}"
+
+
+def _token_expiry(token):
+    """Returns the `exp` claim of a JWT token without verifying it.
+
+    Returns None if the token is not a readable JWT or its `exp` is not a
+    number, so callers log in again.
+    """
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        claims = orjson.loads(base64.urlsafe_b64decode(payload))
+    except (IndexError, ValueError):
+        return None
+    exp = claims.get("exp") if isinstance(claims, dict) else None
+    return exp if isinstance(exp, (int, float)) else None
+
+
+def refresh_if_expiring(username, password, leeway=60, base_url="http://localhost:8000"):
+    """Logs in again if the session token is missing or about to expire.
+
+    Args:
+        username (str): The username to login with.
+        password (str): The password for the user.
+        leeway (int): Seconds before expiry at which the token is renewed.
+        base_url (str): The base URL of the API server.
+    """
+    auth_header = _SESSION.headers.get("Authorization", "")
+    token = auth_header.removeprefix("Bearer ")
+    expiry = _token_expiry(token) if token else None
+    if expiry is None or expiry - time.time() < leeway:
+        token = login(username, password, base_url)["access_token"]
+        set_auth_token(token)
+    return token
+
+
+def set_one_shot(enabled):
+    """Switches between pooled and one-shot connections.
+
+    One-shot mode suits scripts that make a handful of calls and exit: no
+    sockets are kept open after a call returns, so nothing lingers at
+    interpreter shutdown. Bulk callers should leave it off to reuse the pool.
+
+    Args:
+        enabled (bool): Whether to close the connection after every call.
+    """
+    global _ONE_SHOT
+    _ONE_SHOT = enabled
+
+
+def _send(method, url, **kwargs):
+    """Sends a request on the shared session, or a throwaway one if one-shot."""
+    if not _ONE_SHOT:
+        return _SESSION.request(method, url, **kwargs)
+    session = requests.Session()
+    # A fresh adapter, not _ADAPTER, so the pool isn't shared but the retry
+    # policy still applies.
+    adapter = HTTPAdapter(max_retries=_RETRY)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update(_SESSION.headers)
+    session.headers["Connection"] = "close"
+    try:
+        return session.request(method, url, **kwargs)
+    finally:
+        session.close()
+
+
+def _conditional_get(url):
+    """GETs a JSON resource, revalidating any cached copy by its ETag.
+
+    A 304 answer re-parses the cached body instead of transferring it again,
+    so every caller gets its own copy. Servers that send no ETag are simply
+    never cached.
+    """
+    with _ETAG_LOCK:
+        cached = _ETAG_CACHE.get(url)
+        if cached:
+            _ETAG_CACHE.move_to_end(url)
+    headers = {"If-None-Match": cached[0]} if cached else None
+    response = _send("GET", url, headers=headers)
+    if cached and response.status_code == 304:
+        return orjson.loads(cached[1])
+    response.raise_for_status()
+    data = _decode(response)
+    etag = response.headers.get("ETag")
+    if etag:
+        with _ETAG_LOCK:
+            _ETAG_CACHE[url] = (etag, response.content)
+            _ETAG_CACHE.move_to_end(url)
+            if len(_ETAG_CACHE) > _ETAG_CACHE_SIZE:
+                _ETAG_CACHE.popitem(last=False)
+    return data
+
+
+def close_session():
+    """Closes the pooled connections held by the shared session."""
+    _SESSION.close()
+
 
 def register_user(username, password, base_url="http://localhost:8000"):
     """Registers a new user.
@@ -9,28 +255,19 @@ def register_user(username, password, base_url="http://localhost:8000"):
         password (str): The password for the new user.
         base_url (str): The base URL of the API server.
     """
-    register_url = f"{base_url}/register"
+    register_url = _urls(base_url).register
     user_data = {
         "username": username,
         "password": password
     }
-    headers = {
-        "Content-Type": "application/json"
-    }
 
     try:
-        response = requests.post(register_url, data=json.dumps(user_data), headers=headers)
+        response = _send("POST", register_url, json=user_data)
         response.raise_for_status()
-        return response.json()
+        return _decode(response)
 
     except requests.exceptions.HTTPError as http_err:
-        print(f"HTTP error occurred: {http_err}")
-        if response.status_code == 400:
-            print("Username may already be registered.")
-        raise
-    except requests.exceptions.RequestException as req_err:
-        print(f"A request error occurred: {req_err}")
-        raise
+        raise _api_error(http_err, response.status_code, response) from http_err
 
 def get_polls(skip=0, limit=10, base_url="http://localhost:8000"):
     """Fetches a paginated list of polls.
@@ -40,23 +277,16 @@ def get_polls(skip=0, limit=10, base_url="http://localhost:8000"):
         limit (int): The maximum number of polls to return.
         base_url (str): The base URL of the API server.
     """
-    polls_url = f"{base_url}/polls"
-    params = {
-        "skip": skip,
-        "limit": limit
-    }
+    # Build the query string directly rather than having requests urlencode
+    # a params dict on every call; int() keeps the values safe to inline.
+    polls_url = f"{_urls(base_url).polls}?skip={int(skip)}&limit={int(limit)}"
 
     try:
-        response = requests.get(polls_url, params=params)
-        response.raise_for_status()
-        return response.json()
+        return _conditional_get(polls_url)
 
     except requests.exceptions.HTTPError as http_err:
-        print(f"HTTP error occurred: {http_err}")
-        raise
-    except requests.exceptions.RequestException as req_err:
-        print(f"A request error occurred: {req_err}")
-        raise
+        response = http_err.response
+        raise _api_error(http_err, response.status_code, response) from http_err
 
 def login(username, password, base_url="http://localhost:8000"):
     """Logs in a user to get a JWT token.
@@ -66,95 +296,68 @@ def login(username, password, base_url="http://localhost:8000"):
         password (str): The password for the user.
         base_url (str): The base URL of the API server.
     """
-    login_url = f"{base_url}/login"
+    login_url = _urls(base_url).login
     form_data = {
         "username": username,
         "password": password
     }
-    headers = {
-        "Content-Type": "application/x-www-form-urlencoded"
-    }
 
     try:
-        response = requests.post(login_url, data=form_data, headers=headers)
+        response = _send("POST", login_url, data=form_data, headers=_FORM_HEADERS)
         response.raise_for_status()
-        return response.json()
+        return _decode(response)
 
     except requests.exceptions.HTTPError as http_err:
-        print(f"HTTP error occurred: {http_err}")
-        if response.status_code == 400:
-            print("Incorrect username or password.")
-        raise
-    except requests.exceptions.RequestException as req_err:
-        print(f"A request error occurred: {req_err}")
-        raise
+        raise _api_error(http_err, response.status_code, response) from http_err
 
-def create_poll(question, options, token, base_url="http://localhost:8000"):
+def create_poll(question, options, token=None, base_url="http://localhost:8000"):
     """Creates a new poll.
 
     Args:
         question (str): The question for the poll.
         options (list): A list of strings for the poll options.
-        token (str): The JWT token for authentication.
+        token (str): Optional JWT token overriding the one set with
+            set_auth_token.
         base_url (str): The base URL of the API server.
     """
-    polls_url = f"{base_url}/polls"
+    polls_url = _urls(base_url).polls
     poll_data = {
         "question": question,
         "options": options
     }
-    headers = {
-        "Content-Type": "application/json",
-        "Authorization": f"Bearer {token}"
-    }
+    headers = {"Authorization": f"Bearer {token}"} if token else None
 
     try:
-        response = requests.post(polls_url, data=json.dumps(poll_data), headers=headers)
+        response = _send("POST", polls_url, json=poll_data, headers=headers)
         response.raise_for_status()
-        return response.json()
+        return _decode(response)
 
     except requests.exceptions.HTTPError as http_err:
-        print(f"HTTP error occurred: {http_err}")
-        if response.status_code == 401:
-            print("Unauthorized. Please check your token.")
-        raise
-    except requests.exceptions.RequestException as req_err:
-        print(f"A request error occurred: {req_err}")
-        raise
+        raise _api_error(http_err, response.status_code, response) from http_err
 
-def cast_vote(poll_id, option_id, token, base_url="http://localhost:8000"):
+def cast_vote(poll_id, option_id, token=None, base_url="http://localhost:8000"):
     """Casts a vote on a poll.
 
     Args:
         poll_id (int): The ID of the poll to vote on.
         option_id (int): The ID of the option to vote for.
-        token (str): The JWT token for authentication.
+        token (str): Optional JWT token overriding the one set with
+            set_auth_token.
         base_url (str): The base URL of the API server.
     """
-    vote_url = f"{base_url}/polls/{poll_id}/vote"
+    vote_url = _urls(base_url).vote_tpl.format(poll_id=poll_id)
     vote_data = {
         "option_id": option_id
     }
-    headers = {
-        "Content-Type": "application/json",
-        "Authorization": f"Bearer {token}"
-    }
+    headers = {"Authorization": f"Bearer {token}"} if token else None
 
     try:
-        response = requests.post(vote_url, data=json.dumps(vote_data), headers=headers)
+        response = _send("POST", vote_url, json=vote_data, headers=headers)
         response.raise_for_status()
-        return response.json()
+        return _decode(response)
 
     except requests.exceptions.HTTPError as http_err:
-        print(f"HTTP error occurred: {http_err}")
-        if response.status_code == 401:
-            print("Unauthorized. Please check your token.")
-        elif response.status_code == 404:
-            print("Poll or option not found.")
-        raise
-    except requests.exceptions.RequestException as req_err:
-        print(f"A request error occurred: {req_err}")
-        raise
+        raise _api_error(http_err, response.status_code, response) from http_err
 
 def get_poll_results(poll_id, base_url="http://localhost:8000"):
     """Retrieves the results for a poll.
@@ -163,26 +366,229 @@ def get_poll_results(poll_id, base_url="http://localhost:8000"):
         poll_id (int): The ID of the poll to get results for.
         base_url (str): The base URL of the API server.
     """
-    results_url = f"{base_url}/polls/{poll_id}/results"
+    results_url = _urls(base_url).results_tpl.format(poll_id=poll_id)
 
     try:
-        response = requests.get(results_url)
-        response.raise_for_status()
-        return response.json()
+        return _conditional_get(results_url)
 
     except requests.exceptions.HTTPError as http_err:
-        print(f"HTTP error occurred: {http_err}")
-        if response.status_code == 404:
-            print("Poll not found.")
+        response = http_err.response
+        raise _api_error(http_err, response.status_code, response) from http_err
+
+def get_poll_results_bulk(poll_ids, max_workers=10, base_url="http://localhost:8000"):
+    """Retrieves the results for several polls in parallel threads.
+
+    Args:
+        poll_ids (list): The IDs of the polls to get results for.
+        max_workers (int): The maximum number of concurrent requests.
+        base_url (str): The base URL of the API server.
+
+    Returns:
+        list: The results for each poll, in the order of poll_ids.
+    """
+    with ThreadPoolExecutor(min(max_workers, _POOL_MAXSIZE)) as executor:
+        return list(executor.map(lambda poll_id: get_poll_results(poll_id, base_url), poll_ids))
+
+def cast_vote_bulk(votes, token=None, max_workers=10, base_url="http://localhost:8000"):
+    """Casts several votes in parallel threads.
+
+    Args:
+        votes (list): (poll_id, option_id) pairs to vote for.
+        token (str): Optional JWT token overriding the one set with
+            set_auth_token.
+        max_workers (int): The maximum number of concurrent requests.
+        base_url (str): The base URL of the API server.
+
+    Returns:
+        list: The vote confirmations, in the order of votes.
+    """
+    with ThreadPoolExecutor(min(max_workers, _POOL_MAXSIZE)) as executor:
+        return list(executor.map(
+            lambda vote: cast_vote(vote[0], vote[1], token, base_url), votes
+        ))
+
+def open_async_session(base_url="http://localhost:8000", one_shot=False):
+    """Opens an aiohttp session for the async client functions.
+
+    The session must be used as an async context manager (or closed
+    explicitly) by the caller.
+
+    Args:
+        base_url (str): The base URL of the API server.
+        one_shot (bool): Close each connection after its request instead of
+            keeping it alive for reuse.
+    """
+    if one_shot:
+        connector = aiohttp.TCPConnector(force_close=True, enable_cleanup_closed=True)
+    else:
+        connector = aiohttp.TCPConnector(limit=100, ttl_dns_cache=300)
+    return aiohttp.ClientSession(base_url=base_url, connector=connector)
+
+async def aregister_user(session, username, password):
+    """Registers a new user asynchronously.
+
+    Args:
+        session (aiohttp.ClientSession): A session from open_async_session.
+        username (str): The username to register.
+        password (str): The password for the new user.
+    """
+    user_data = {
+        "username": username,
+        "password": password
+    }
+
+    # Stays None if the error is raised before a response is bound
+    # (e.g. TooManyRedirects).
+    response = None
+    try:
+        async with session.post("/register", json=user_data) as response:
+            response.raise_for_status()
+            return await _adecode(response)
+
+    # A 2xx with an unreadable body is not an API error; don't map its status.
+    except aiohttp.ContentTypeError:
+        raise
+    except aiohttp.ClientResponseError as http_err:
+        raise _api_error(http_err, http_err.status, response) from http_err
+
+async def aget_polls(session, skip=0, limit=10):
+    """Fetches a paginated list of polls asynchronously.
+
+    Args:
+        session (aiohttp.ClientSession): A session from open_async_session.
+        skip (int): The number of polls to skip.
+        limit (int): The maximum number of polls to return.
+    """
+    params = {
+        "skip": skip,
+        "limit": limit
+    }
+
+    response = None
+    try:
+        async with session.get("/polls", params=params) as response:
+            response.raise_for_status()
+            return await _adecode(response)
+
+    except aiohttp.ContentTypeError:
+        raise
+    except aiohttp.ClientResponseError as http_err:
+        raise _api_error(http_err, http_err.status, response) from http_err
+
+async def alogin(session, username, password):
+    """Logs in a user asynchronously to get a JWT token.
+
+    Args:
+        session (aiohttp.ClientSession): A session from open_async_session.
+        username (str): The username to login with.
+        password (str): The password for the user.
+    """
+    form_data = {
+        "username": username,
+        "password": password
+    }
+
+    response = None
+    try:
+        async with session.post("/login", data=form_data) as response:
+            response.raise_for_status()
+            return await _adecode(response)
+
+    except aiohttp.ContentTypeError:
+        raise
+    except aiohttp.ClientResponseError as http_err:
+        raise _api_error(http_err, http_err.status, response) from http_err
+
+async def acreate_poll(session, question, options, token):
+    """Creates a new poll asynchronously.
+
+    Args:
+        session (aiohttp.ClientSession): A session from open_async_session.
+        question (str): The question for the poll.
+        options (list): A list of strings for the poll options.
+        token (str): The JWT token for authentication.
+    """
+    poll_data = {
+        "question": question,
+        "options": options
+    }
+    headers = {
+        "Authorization": f"Bearer {token}"
+    }
+
+    response = None
+    try:
+        async with session.post("/polls", json=poll_data, headers=headers) as response:
+            response.raise_for_status()
+            return await _adecode(response)
+
+    except aiohttp.ContentTypeError:
+        raise
+    except aiohttp.ClientResponseError as http_err:
+        raise _api_error(http_err, http_err.status, response) from http_err
+
+async def acast_vote(session, poll_id, option_id, token):
+    """Casts a vote on a poll asynchronously.
+
+    Args:
+        session (aiohttp.ClientSession): A session from open_async_session.
+        poll_id (int): The ID of the poll to vote on.
+        option_id (int): The ID of the option to vote for.
+        token (str): The JWT token for authentication.
+    """
+    vote_data = {
+        "option_id": option_id
+    }
+    headers = {
+        "Authorization": f"Bearer {token}"
+    }
+
+    response = None
+    try:
+        async with session.post(f"/polls/{poll_id}/vote", json=vote_data, headers=headers) as response:
+            response.raise_for_status()
+            return await _adecode(response)
+
+    except aiohttp.ContentTypeError:
         raise
-    except requests.exceptions.RequestException as req_err:
-        print(f"A request error occurred: {req_err}")
+    except aiohttp.ClientResponseError as http_err:
+        raise _api_error(http_err, http_err.status, response) from http_err
+
+async def aget_poll_results(session, poll_id):
+    """Retrieves the results for a poll asynchronously.
+
+    Args:
+        session (aiohttp.ClientSession): A session from open_async_session.
+        poll_id (int): The ID of the poll to get results for.
+    """
+    response = None
+    try:
+        async with session.get(f"/polls/{poll_id}/results") as response:
+            response.raise_for_status()
+            return await _adecode(response)
+
+    except aiohttp.ContentTypeError:
         raise
+    except aiohttp.ClientResponseError as http_err:
+        raise _api_error(http_err, http_err.status, response) from http_err
+
+async def aget_poll_results_bulk(session, poll_ids):
+    """Retrieves the results for several polls concurrently.
+
+    Args:
+        session (aiohttp.ClientSession): A session from open_async_session.
+        poll_ids (list): The IDs of the polls to get results for.
+
+    Returns:
+        list: The results for each poll, in the order of poll_ids.
+    """
+    return await asyncio.gather(*[aget_poll_results(session, poll_id) for poll_id in poll_ids])
 
 # Example usage:
 if __name__ == "__main__":
+    # A handful of calls then exit: skip connection pooling altogether.
+    set_one_shot(True)
     # Use a unique username to avoid conflicts on re-runs
-    import time
     username = f"testuser_{int(time.time())}"
     password = "a-secure-password"
     
@@ -191,7 +597,8 @@ if __name__ == "__main__":
         new_user = register_user(username, password)
         print("User registered successfully:")
         print(new_user)
-    except requests.exceptions.RequestException as e:
+    except (PollyAPIError, requests.exceptions.RequestException) as e:
+        print(e)
         print(f"Failed to register user.")
         exit()
 
@@ -204,8 +611,10 @@ if __name__ == "__main__":
         if not token:
             print("Failed to get access token from login response.")
             exit()
+        set_auth_token(token)
         print("Logged in successfully. Token received.")
-    except requests.exceptions.RequestException as e:
+    except (PollyAPIError, requests.exceptions.RequestException) as e:
+        print(e)
         print(f"Failed to log in.")
         exit()
 
@@ -215,7 +624,7 @@ if __name__ == "__main__":
     try:
         question = "What is your favorite programming language?"
         options = ["Python", "JavaScript", "Go", "Rust"]
-        new_poll = create_poll(question, options, token)
+        new_poll = create_poll(question, options)
         print("Poll created successfully:")
         print(json.dumps(new_poll, indent=2))
         
@@ -227,7 +636,8 @@ if __name__ == "__main__":
             print("Failed to get poll ID or option ID from the created poll.")
             exit()
 
-    except requests.exceptions.RequestException as e:
+    except (PollyAPIError, requests.exceptions.RequestException) as e:
+        print(e)
         print(f"Failed to create poll.")
         exit()
 
@@ -235,10 +645,11 @@ if __name__ == "__main__":
 
     print(f"--- Step 4: Casting a vote on poll {poll_id} for option {option_id} ---")
     try:
-        vote_confirmation = cast_vote(poll_id, option_id, token)
+        vote_confirmation = cast_vote(poll_id, option_id)
         print("Vote cast successfully:")
         print(json.dumps(vote_confirmation, indent=2))
-    except requests.exceptions.RequestException as e:
+    except (PollyAPIError, requests.exceptions.RequestException) as e:
+        print(e)
         print(f"Failed to cast vote.")
         # We can still try to get results even if voting fails (e.g., if user already voted)
         pass
@@ -250,5 +661,6 @@ if __name__ == "__main__":
         results = get_poll_results(poll_id)
         print("Poll results retrieved successfully:")
         print(json.dumps(results, indent=2))
-    except requests.exceptions.RequestException as e:
+    except (PollyAPIError, requests.exceptions.RequestException) as e:
+        print(e)
         print(f"Failed to retrieve poll results.")
\ No newline at end of file
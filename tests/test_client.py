@@ -0,0 +1,353 @@
+import asyncio
+import base64
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+import aiohttp
+import pytest
+import requests
+import urllib3
+
+import client
+
+
+def reply(status=200, payload=None, headers=None):
+    """A canned response for the stub server: JSON payload unless bytes."""
+    body = payload if isinstance(payload, bytes) else json.dumps(payload).encode()
+    return status, body, {"Content-Type": "application/json", **(headers or {})}
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Serves the replies queued for each path and records every request.
+
+    The last reply queued for a path is repeated for any further requests.
+    Unknown paths get a 404.
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def _serve(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length)
+        self.server.requests.append((self.command, self.path, self.headers, body))
+        queue = self.server.routes.get(self.path) or [reply(404, {"detail": "Not Found"})]
+        status, data, headers = queue.pop(0) if len(queue) > 1 else queue[0]
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    do_GET = do_POST = _serve
+
+    def log_message(self, format, *args):
+        pass
+
+
+def make_token(claims):
+    def encode(part):
+        return base64.urlsafe_b64encode(json.dumps(part).encode()).rstrip(b"=").decode()
+
+    return f"{encode({'alg': 'HS256'})}.{encode(claims)}.signature"
+
+
+@pytest.fixture(autouse=True)
+def reset_client_state():
+    client._SESSION.headers.pop("Authorization", None)
+    client.set_one_shot(False)
+    client._ETAG_CACHE.clear()
+    yield
+    client._SESSION.headers.pop("Authorization", None)
+    client.set_one_shot(False)
+    client._ETAG_CACHE.clear()
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    httpd.routes = {}
+    httpd.requests = []
+    httpd.url = f"http://127.0.0.1:{httpd.server_address[1]}"
+    thread = threading.Thread(target=httpd.serve_forever, args=(0.01,), daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def run_async(server, func, *args):
+    """Runs an async client function on a fresh session against the server."""
+    async def main():
+        async with client.open_async_session(server.url) as session:
+            return await func(session, *args)
+
+    return asyncio.run(main())
+
+
+def test_async_get_polls(server):
+    server.routes["/polls?skip=5&limit=20"] = [reply(200, [{"id": 1}])]
+    assert run_async(server, client.aget_polls, 5, 20) == [{"id": 1}]
+
+
+def test_async_cast_vote_sends_token_and_payload(server):
+    server.routes["/polls/3/vote"] = [reply(200, {"poll_id": 3, "option_id": 7})]
+    assert run_async(server, client.acast_vote, 3, 7, "tok") == {"poll_id": 3, "option_id": 7}
+    method, path, headers, body = server.requests[0]
+    assert method == "POST"
+    assert headers["Authorization"] == "Bearer tok"
+    assert json.loads(body) == {"option_id": 7}
+
+
+def test_async_get_poll_results_bulk_keeps_order(server):
+    for poll_id in (1, 2, 3):
+        server.routes[f"/polls/{poll_id}/results"] = [reply(200, {"poll_id": poll_id})]
+    results = run_async(server, client.aget_poll_results_bulk, [3, 1, 2])
+    assert [r["poll_id"] for r in results] == [3, 1, 2]
+
+
+def test_async_error_status_raises(server):
+    with pytest.raises(client.NotFoundError) as exc_info:
+        run_async(server, client.aget_poll_results, 42)
+    assert isinstance(exc_info.value.__cause__, aiohttp.ClientResponseError)
+    assert exc_info.value.response.status == 404
+
+
+def test_async_too_many_redirects(server):
+    server.routes["/polls/1/results"] = [reply(302, b"", {"Location": "/polls/1/results"})]
+    with pytest.raises(client.PollyAPIError) as exc_info:
+        run_async(server, client.aget_poll_results, 1)
+    assert isinstance(exc_info.value.__cause__, aiohttp.TooManyRedirects)
+    assert exc_info.value.response is None
+
+
+def test_token_expiry():
+    assert client._token_expiry(make_token({"sub": "alice", "exp": 1234})) == 1234
+    assert client._token_expiry(make_token({"sub": "alice"})) is None
+
+
+@pytest.mark.parametrize(
+    "token",
+    ["not-a-jwt", "a.!!!.c", "a.bm90IGpzb24.c", make_token([1]), make_token({"exp": "soon"})],
+)
+def test_token_expiry_unreadable_token(token):
+    assert client._token_expiry(token) is None
+
+
+@pytest.mark.parametrize(
+    "current",
+    [
+        None,
+        "garbage",
+        make_token({"exp": "soon"}),
+        make_token({"exp": 0}),
+        make_token({"exp": int(time.time()) + 30}),
+    ],
+    ids=["missing", "unreadable", "non-numeric-exp", "expired", "within-leeway"],
+)
+def test_refresh_if_expiring_logs_in(server, current):
+    new_token = make_token({"exp": int(time.time()) + 3600})
+    server.routes["/login"] = [reply(200, {"access_token": new_token, "token_type": "bearer"})]
+    if current:
+        client.set_auth_token(current)
+    assert client.refresh_if_expiring("alice", "secret", base_url=server.url) == new_token
+    assert client._SESSION.headers["Authorization"] == f"Bearer {new_token}"
+    assert [r[1] for r in server.requests] == ["/login"]
+
+
+def test_refresh_if_expiring_keeps_fresh_token(server):
+    token = make_token({"exp": int(time.time()) + 3600})
+    client.set_auth_token(token)
+    assert client.refresh_if_expiring("alice", "secret", base_url=server.url) == token
+    assert server.requests == []
+
+
+def test_session_token_and_per_call_override(server):
+    server.routes["/polls/1/vote"] = [reply(200, {})]
+    client.set_auth_token("session-token")
+    client.cast_vote(1, 2, base_url=server.url)
+    client.cast_vote(1, 2, token="override", base_url=server.url)
+    assert [r[2]["Authorization"] for r in server.requests] == [
+        "Bearer session-token",
+        "Bearer override",
+    ]
+
+
+def test_get_poll_results_bulk_keeps_order(server):
+    for poll_id in (1, 2, 3):
+        server.routes[f"/polls/{poll_id}/results"] = [reply(200, {"poll_id": poll_id})]
+    results = client.get_poll_results_bulk([3, 1, 2], max_workers=3, base_url=server.url)
+    assert [r["poll_id"] for r in results] == [3, 1, 2]
+
+
+def test_cast_vote_bulk(server):
+    for poll_id in (1, 2, 3):
+        server.routes[f"/polls/{poll_id}/vote"] = [reply(200, {"poll_id": poll_id})]
+    votes = [(3, 30), (1, 10), (2, 20)]
+    results = client.cast_vote_bulk(votes, token="tok", max_workers=3, base_url=server.url)
+    assert [r["poll_id"] for r in results] == [3, 1, 2]
+    sent = {path: (headers["Authorization"], json.loads(body)) for _, path, headers, body in server.requests}
+    assert sent == {
+        f"/polls/{poll_id}/vote": ("Bearer tok", {"option_id": option_id})
+        for poll_id, option_id in votes
+    }
+
+
+@pytest.mark.parametrize(
+    "status_code, error",
+    [
+        (400, client.ConflictError),
+        (401, client.AuthError),
+        (404, client.NotFoundError),
+        (500, client.PollyAPIError),
+    ],
+)
+def test_error_status_mapping(server, status_code, error):
+    server.routes["/polls/1/vote"] = [reply(status_code, {"detail": "nope"})]
+    with pytest.raises(error) as exc_info:
+        client.cast_vote(1, 2, base_url=server.url)
+    assert type(exc_info.value) is error
+    assert exc_info.value.response.status_code == status_code
+    assert isinstance(exc_info.value.__cause__, requests.exceptions.HTTPError)
+
+
+def test_get_polls_builds_query_string(server):
+    server.routes["/polls?skip=5&limit=20"] = [reply(200, [{"id": 6}])]
+    assert client.get_polls(skip="5", limit=20, base_url=server.url) == [{"id": 6}]
+    with pytest.raises(ValueError):
+        client.get_polls(skip="5&limit=1000", base_url=server.url)
+    assert [r[1] for r in server.requests] == ["/polls?skip=5&limit=20"]
+
+
+def test_urls_cached_per_base_url():
+    urls = client._urls("http://api.test")
+    assert client._urls("http://api.test") is urls
+    assert urls.vote_tpl.format(poll_id=4) == "http://api.test/polls/4/vote"
+    assert urls.results_tpl.format(poll_id=4) == "http://api.test/polls/4/results"
+
+
+def test_request_content_types(server):
+    server.routes["/login"] = [reply(200, {"access_token": "tok"})]
+    server.routes["/register"] = [reply(200, {"id": 1})]
+    client.login("alice", "secret", base_url=server.url)
+    client.register_user("alice", "secret", base_url=server.url)
+    content_types = [r[2]["Content-Type"] for r in server.requests]
+    assert content_types == ["application/x-www-form-urlencoded", "application/json"]
+    assert client._SESSION.headers["Content-Type"] == "application/json"
+
+
+def test_one_shot_uses_closing_session(server, monkeypatch):
+    server.routes["/polls?skip=0&limit=10"] = [reply(200, [])]
+    used = []
+    request = requests.Session.request
+
+    def spy(self, *args, **kwargs):
+        used.append(self)
+        return request(self, *args, **kwargs)
+
+    monkeypatch.setattr(requests.Session, "request", spy)
+    client.set_one_shot(True)
+    client.get_polls(base_url=server.url)
+    client.set_one_shot(False)
+    client.get_polls(base_url=server.url)
+    assert used[0] is not client._SESSION
+    assert used[1] is client._SESSION
+    assert [r[2]["Connection"] for r in server.requests] == ["close", "keep-alive"]
+
+
+def test_async_one_shot_session_forces_close(server):
+    async def main():
+        async with client.open_async_session(server.url, one_shot=True) as session:
+            return session.connector.force_close
+
+    assert asyncio.run(main())
+
+
+def test_get_retries_transient_status(server):
+    server.routes["/polls/1/results"] = [reply(503), reply(502), reply(200, {"poll_id": 1})]
+    assert client.get_poll_results(1, base_url=server.url) == {"poll_id": 1}
+    assert len(server.requests) == 3
+
+
+def test_post_does_not_retry_on_status(server):
+    server.routes["/polls/1/vote"] = [reply(503), reply(200, {"poll_id": 1})]
+    with pytest.raises(client.PollyAPIError) as exc_info:
+        client.cast_vote(1, 2, base_url=server.url)
+    assert exc_info.value.response.status_code == 503
+    assert len(server.requests) == 1
+
+
+def test_retry_fails_fast_on_non_transient_errors():
+    error = urllib3.exceptions.SSLError("certificate verify failed")
+    with pytest.raises(urllib3.exceptions.MaxRetryError):
+        client._RETRY.increment(method="GET", url="/polls", error=error)
+    retry = client._RETRY.increment(
+        method="POST", url="/polls", error=urllib3.exceptions.ConnectTimeoutError()
+    )
+    assert retry.total == 2
+
+
+def test_conditional_get_replays_cached_body_on_304(server):
+    body = {"poll_id": 1, "results": [{"option_id": 1, "vote_count": 3}]}
+    server.routes["/polls/1/results"] = [reply(200, body, {"ETag": '"v1"'}), reply(304, b"")]
+    first = client.get_poll_results(1, base_url=server.url)
+    assert first == body
+    assert "If-None-Match" not in server.requests[0][2]
+
+    first["results"].append("mutated")
+    second = client.get_poll_results(1, base_url=server.url)
+    assert server.requests[1][2]["If-None-Match"] == '"v1"'
+    assert second == body
+    assert client.get_poll_results(1, base_url=server.url) is not second
+
+
+def test_conditional_get_skips_cache_without_etag(server):
+    server.routes["/polls?skip=0&limit=10"] = [reply(200, [])]
+    client.get_polls(base_url=server.url)
+    client.get_polls(base_url=server.url)
+    assert "If-None-Match" not in server.requests[1][2]
+    assert not client._ETAG_CACHE
+
+
+def test_etag_cache_is_bounded(server, monkeypatch):
+    monkeypatch.setattr(client, "_ETAG_CACHE_SIZE", 2)
+    for skip in range(3):
+        server.routes[f"/polls?skip={skip}&limit=10"] = [reply(200, [], {"ETag": f'"{skip}"'})]
+        client.get_polls(skip=skip, base_url=server.url)
+    assert list(client._ETAG_CACHE) == [
+        f"{server.url}/polls?skip=1&limit=10",
+        f"{server.url}/polls?skip=2&limit=10",
+    ]
+
+
+@pytest.mark.parametrize("body", [b"", b"<html>proxy error</html>"], ids=["empty", "html"])
+def test_non_json_body_raises_request_exception(server, body):
+    server.routes["/polls?skip=0&limit=10"] = [reply(200, body)]
+    with pytest.raises(requests.exceptions.JSONDecodeError) as exc_info:
+        client.get_polls(base_url=server.url)
+    assert isinstance(exc_info.value, requests.exceptions.RequestException)
+    assert exc_info.value.response.status_code == 200
+
+
+def test_one_shot_keeps_retry_policy(server):
+    server.routes["/polls/1/results"] = [reply(503), reply(503), reply(200, {"poll_id": 1})]
+    client.set_one_shot(True)
+    assert client.get_poll_results(1, base_url=server.url) == {"poll_id": 1}
+    assert [r[2]["Connection"] for r in server.requests] == ["close"] * 3
+
+
+@pytest.mark.parametrize("content_type", ["application/json", "text/html"])
+def test_async_non_json_body_raises_client_error(server, content_type):
+    server.routes["/polls/1/results"] = [
+        reply(200, b"<html>proxy error</html>", {"Content-Type": content_type})
+    ]
+    with pytest.raises(aiohttp.ContentTypeError) as exc_info:
+        run_async(server, client.aget_poll_results, 1)
+    assert not isinstance(exc_info.value, client.PollyAPIError)
+    assert isinstance(exc_info.value, aiohttp.ClientError)
+    assert exc_info.value.status == 200